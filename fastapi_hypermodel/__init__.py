@@ -21,9 +21,11 @@ from .url_for import UrlFor
 from .url_type import URL_TYPE_SCHEMA, UrlType
 from .utils import (
     InvalidAttribute,
+    compile_template_params,
     extract_value_by_name,
     get_hal_link_href,
     get_route_from_app,
+    resolve_compiled_params,
     resolve_param_values,
 )
 
@@ -49,10 +51,12 @@ __all__ = [
     "SirenResponse",
     "UrlFor",
     "UrlType",
+    "compile_template_params",
     "extract_value_by_name",
     "get_hal_link_href",
     "get_route_from_app",
     "get_siren_action",
     "get_siren_link",
+    "resolve_compiled_params",
     "resolve_param_values",
 ]
@@ -13,6 +13,11 @@ from typing import (
     Union,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse
@@ -309,4 +314,8 @@ class HALResponse(JSONResponse):
 
     def render(self: Self, content: Any) -> bytes:
         self._validate(content)
-        return super().render(content)
+
+        if orjson is None:
+            return super().render(content)
+
+        return orjson.dumps(content, default=str)  # pylint: disable=no-member
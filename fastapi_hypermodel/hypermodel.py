@@ -69,6 +69,21 @@ class AbstractHyperField(ABC, Generic[T]):
     ) -> Optional[T]:
         raise NotImplementedError
 
+    def bind_to_app(self: Self, app: Starlette) -> None:
+        """Hook for subclasses to resolve app-dependent state ahead of time."""
+
+
+def _bind_app_to_field_defaults(model: Type["HyperModel"], app: Starlette) -> None:
+    for field in model.model_fields.values():
+        default = field.default
+        defaults = default if isinstance(default, (list, tuple)) else [default]
+        for value in defaults:
+            if isinstance(value, AbstractHyperField):
+                value.bind_to_app(app)
+
+    for subclass in model.__subclasses__():
+        _bind_app_to_field_defaults(subclass, app)
+
 
 class HyperModel(BaseModel):
     _app: ClassVar[Optional[Starlette]] = None
@@ -103,6 +118,7 @@ class HyperModel(BaseModel):
             app (FastAPI): Application to generate URLs from
         """
         cls._app = app
+        _bind_app_to_field_defaults(cls, app)
 
     @staticmethod
     def _parse_uri(values: Any, uri_template: str) -> str:
@@ -62,6 +62,12 @@ class LinkSet(LinkSetType, AbstractHyperField[LinkSetType]):
 
         return json_schema
 
+    def bind_to_app(self: Self, app: Starlette) -> None:
+        for hyperfields in self._mapping.values():
+            fields = hyperfields if isinstance(hyperfields, Sequence) else [hyperfields]
+            for hyperfield in fields:
+                hyperfield.bind_to_app(app)
+
     def __call__(
         self: Self, app: Optional[Starlette], values: Mapping[str, Any]
     ) -> LinkSetType:
@@ -1,31 +1,48 @@
 from __future__ import annotations
 
+import datetime
+from contextlib import suppress
+from functools import lru_cache
 from itertools import starmap
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
+    Hashable,
     List,
     Mapping,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
     cast,
+    get_args,
+    get_origin,
 )
+from weakref import WeakKeyDictionary
 
 import jsonschema
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from fastapi.routing import APIRoute
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     PrivateAttr,
+    TypeAdapter,
     field_validator,
     model_serializer,
     model_validator,
 )
 from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse
 from starlette.routing import Route
@@ -34,20 +51,85 @@ from typing_extensions import Self
 from fastapi_hypermodel.hypermodel import AbstractHyperField, HasName, HyperModel
 from fastapi_hypermodel.url_type import UrlType
 from fastapi_hypermodel.utils import (
+    compile_template_params,
     get_route_from_app,
-    resolve_param_values,
+    resolve_compiled_params,
 )
 
 from .siren_schema import schema
 
+# SirenLinkFor.__call__, SirenActionFor.__call__ and
+# SirenFieldType.from_field_info only ever receive internally-generated,
+# already well-typed values, so they build their outputs with model_construct
+# and deliberately bypass the `mandatory` field_validators. The public helpers
+# get_siren_link and get_siren_action keep model_validate since they consume
+# untrusted response payloads.
+
+
+# Parameterless URLs are constant per application and repeat across rows of
+# collection responses, so they are memoized here (weakly keyed so test apps
+# can be collected). Parameterized URLs vary per row and are not cached.
+_constant_url_cache: WeakKeyDictionary[Starlette, Dict[str, str]] = WeakKeyDictionary()
+
+
+def _build_uri_path(
+    app: Starlette,
+    endpoint: str,
+    compiled_params: Sequence[Tuple[str, str]],
+    templated: bool,
+    *,
+    values: Mapping[str, Any],
+    route: Union[Route, str],
+) -> UrlType:
+    if templated and isinstance(route, Route):
+        return UrlType(route.path)
+
+    if not compiled_params:
+        urls = _constant_url_cache.get(app)
+        if urls is None:
+            urls = {}
+            _constant_url_cache[app] = urls
+
+        url = urls.get(endpoint)
+        if url is None:
+            url = app.url_path_for(endpoint)
+            urls[endpoint] = url
+
+        return UrlType(url)
+
+    params = resolve_compiled_params(compiled_params, values)
+    return UrlType(app.url_path_for(endpoint, **params))
+
 
 class SirenBase(BaseModel):
     class_: Union[Sequence[str], None] = Field(default=None, alias="class")
     title: Union[str, None] = Field(default=None)
 
+    # These models are built from trusted, internally-generated Python data on
+    # the response path (HAL/Siren output, not external JSON input), so
+    # instances flowing between validators must never be re-validated.
+    model_config = ConfigDict(revalidate_instances="never")
+
+    # Computed once per subclass so serialization does not resolve aliases
+    # through model_fields for every field of every instance.
+    alias_map_: ClassVar[Dict[str, str]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls: Type[Self], **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.alias_map_ = {
+            name: field.alias or name for name, field in cls.model_fields.items()
+        }
+
     @model_serializer
     def serialize(self: Self) -> Mapping[str, Any]:
-        return {self.model_fields[k].alias or k: v for k, v in self if v}
+        alias_map = self.alias_map_
+        return {alias_map.get(k, k): v for k, v in self.__dict__.items() if v}
+
+
+SirenBase.alias_map_ = {
+    name: field.alias or name for name, field in SirenBase.model_fields.items()
+}
 
 
 class SirenLinkType(SirenBase):
@@ -70,6 +152,7 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
     _param_values: Mapping[str, str] = PrivateAttr()
     _templated: bool = PrivateAttr()
     _condition: Union[Callable[[Mapping[str, Any]], bool], None] = PrivateAttr()
+    _param_extractor: Tuple[Tuple[str, str], ...] = PrivateAttr()
 
     # For details on the folllowing fields, check https://datatracker.ietf.org/doc/html/draft-kelly-json-hal
     _title: Union[str, None] = PrivateAttr()
@@ -94,6 +177,7 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
             endpoint.__name__ if isinstance(endpoint, HasName) else endpoint
         )
         self._param_values = param_values or {}
+        self._param_extractor = compile_template_params(param_values)
         self._templated = templated
         self._condition = condition
         self._title = title
@@ -104,11 +188,20 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
     def _get_uri_path(
         self: Self, app: Starlette, values: Mapping[str, Any], route: Union[Route, str]
     ) -> UrlType:
-        if self._templated and isinstance(route, Route):
-            return UrlType(route.path)
+        return _build_uri_path(
+            app,
+            self._endpoint,
+            self._param_extractor,
+            self._templated,
+            values=values,
+            route=route,
+        )
 
-        params = resolve_param_values(self._param_values, values)
-        return UrlType(app.url_path_for(self._endpoint, **params))
+    def bind_to_app(self: Self, app: Starlette) -> None:
+        # The endpoint may belong to a different application; route
+        # resolution then happens lazily on first call as before.
+        with suppress(ValueError):
+            get_route_from_app(app, self._endpoint)
 
     def __call__(
         self: Self, app: Union[Starlette, None], values: Mapping[str, Any]
@@ -116,7 +209,8 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
         if app is None:
             return None
 
-        if self._condition and not self._condition(values):
+        condition = self._condition
+        if condition is not None and not condition(values):
             return None
 
         route = get_route_from_app(app, self._endpoint)
@@ -124,14 +218,33 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
         properties = values.get("properties", values)
         uri_path = self._get_uri_path(app, properties, route)
 
-        # Using model_validate to avoid conflicts with keyword class
-        return SirenLinkType.model_validate({
-            "href": uri_path,
-            "rel": self._rel,
-            "title": self._title,
-            "type": self._type,
-            "class": self._class,
-        })
+        if not self._rel or not uri_path:
+            error_message = "Field rel and href are mandatory"
+            raise ValueError(error_message)
+
+        return SirenLinkType.model_construct(
+            href=uri_path,
+            rel=self._rel,
+            title=self._title,
+            type_=self._type,
+            class_=self._class,
+        )
+
+
+_NoneType = type(None)
+
+# Maps concrete python types to the Siren field type they render as; the
+# values come from the HTML5 input type subset in the Siren schema.
+_TYPE_MAP: Dict[Any, str] = {
+    str: "text",
+    int: "number",
+    float: "number",
+    bool: "checkbox",
+    bytes: "file",
+    datetime.date: "date",
+    datetime.datetime: "datetime",
+    datetime.time: "time",
+}
 
 
 class SirenFieldType(SirenBase):
@@ -141,25 +254,33 @@ class SirenFieldType(SirenBase):
 
     @classmethod
     def from_field_info(cls: Type[Self], name: str, field_info: FieldInfo) -> Self:
-        return cls.model_validate({
-            "name": name,
-            "type": cls.parse_type(field_info.annotation),
-            "value": field_info.default,
-        })
+        default = field_info.default
+        return cls.model_construct(
+            name=name,
+            type_=cls.parse_type(field_info.annotation),
+            value=default if default is not PydanticUndefined else None,
+        )
 
     @staticmethod
     def parse_type(python_type: Union[Type[Any], None]) -> str:
-        type_repr = repr(python_type)
+        if get_origin(python_type) is Union:
+            args = [arg for arg in get_args(python_type) if arg is not _NoneType]
+            python_type = args[0] if args else None
+
+        return _TYPE_MAP.get(python_type, "text")
 
-        text_types = ("str",)
-        if any(text_type in type_repr for text_type in text_types):
-            return "text"
 
-        number_types = ("float", "int")
-        if any(number_type in type_repr for number_type in number_types):
-            return "number"
+@lru_cache(maxsize=None)
+def _fields_for_annotation(
+    annotation: Union[Type[Any], None],
+) -> Tuple[SirenFieldType, ...]:
+    # The field templates are a pure function of the route's body model, so
+    # they are computed once per annotation instead of once per request.
+    model_fields = getattr(annotation, "model_fields", None)
+    if not model_fields:
+        return ()
 
-        return "text"
+    return tuple(starmap(SirenFieldType.from_field_info, model_fields.items()))
 
 
 class SirenActionType(SirenBase):
@@ -185,6 +306,7 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
     _templated: bool = PrivateAttr()
     _condition: Union[Callable[[Mapping[str, Any]], bool], None] = PrivateAttr()
     _populate_fields: bool = PrivateAttr()
+    _param_extractor: Tuple[Tuple[str, str], ...] = PrivateAttr()
 
     # For details on the folllowing fields, check https://github.com/kevinswiber/siren
     _class: Union[Sequence[str], None] = PrivateAttr()
@@ -214,10 +336,15 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
             endpoint.__name__ if isinstance(endpoint, HasName) else endpoint
         )
         self._param_values = param_values or {}
+        self._param_extractor = compile_template_params(param_values)
         self._templated = templated
         self._condition = condition
         self._populate_fields = populate_fields
         self._title = title
+        # With explicit fields the form-encoded default is known here, so
+        # __call__ only falls back for fields computed from the route body.
+        if not type_ and fields:
+            type_ = "application/x-www-form-urlencoded"
         self._type = type_
         self._fields = fields or []
         self._method = method
@@ -227,26 +354,51 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
     def _get_uri_path(
         self: Self, app: Starlette, values: Mapping[str, Any], route: Union[Route, str]
     ) -> UrlType:
-        if self._templated and isinstance(route, Route):
-            return UrlType(route.path)
+        return _build_uri_path(
+            app,
+            self._endpoint,
+            self._param_extractor,
+            self._templated,
+            values=values,
+            route=route,
+        )
 
-        params = resolve_param_values(self._param_values, values)
-        return UrlType(app.url_path_for(self._endpoint, **params))
+    def bind_to_app(self: Self, app: Starlette) -> None:
+        try:
+            route = get_route_from_app(app, self._endpoint)
+        except ValueError:
+            # The endpoint may belong to a different application; route
+            # resolution then happens lazily on first call as before.
+            return
+
+        if isinstance(route, APIRoute) and route.body_field:
+            annotation = cast(Hashable, route.body_field.field_info.annotation)
+            _fields_for_annotation(annotation)
 
     def _prepopulate_fields(
         self: Self, fields: Sequence[SirenFieldType], values: Mapping[str, Any]
-    ) -> List[SirenFieldType]:
+    ) -> Sequence[SirenFieldType]:
         if not self._populate_fields:
-            return list(fields)
+            return fields
 
+        # The templates are shared across requests, so populated copies are
+        # built instead of mutating them in place. Missing values stay None
+        # rather than being coerced to the string "None".
+        populated: List[SirenFieldType] = []
         for field in fields:
             value = values.get(field.name) or field.value
-            field.value = str(value)
-        return list(fields)
+            populated.append(
+                SirenFieldType.model_construct(
+                    name=field.name,
+                    type_=field.type_,
+                    value=str(value) if value is not None else None,
+                )
+            )
+        return populated
 
     def _compute_fields(
         self: Self, route: Route, values: Mapping[str, Any]
-    ) -> List[SirenFieldType]:
+    ) -> Sequence[SirenFieldType]:
         if not isinstance(route, APIRoute):  # pragma: no cover
             route.body_field = ""  # type: ignore
             route = cast(APIRoute, route)
@@ -255,11 +407,8 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
         if not body_field:
             return []
 
-        annotation: Any = body_field.field_info.annotation or {}
-        model_fields: Any = annotation.model_fields if annotation else {}
-        model_fields = cast(Dict[str, FieldInfo], model_fields)
-
-        fields = list(starmap(SirenFieldType.from_field_info, model_fields.items()))
+        annotation = cast(Hashable, body_field.field_info.annotation)
+        fields = _fields_for_annotation(annotation)
         return self._prepopulate_fields(fields, values)
 
     def __call__(
@@ -268,33 +417,40 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
         if app is None:
             return None
 
-        if self._condition and not self._condition(values):
+        condition = self._condition
+        if condition is not None and not condition(values):
             return None
 
         route = get_route_from_app(app, self._endpoint)
 
-        if not self._method:
-            self._method = next(iter(route.methods or {}), None)
+        # Computed into locals rather than written back to the descriptor:
+        # the instance is shared across requests (it usually lives on a class
+        # default), so caching request-derived state on self would leak the
+        # first request's values into every later one.
+        method = self._method or next(iter(route.methods or {}), None)
 
         uri_path = self._get_uri_path(app, values, route)
 
-        if not self._fields:
-            self._fields = self._compute_fields(route, values)
+        fields = self._fields or self._compute_fields(route, values)
 
-        if not self._type and self._fields:
-            self._type = "application/x-www-form-urlencoded"
+        action_type = self._type
+        if not action_type and fields:
+            action_type = "application/x-www-form-urlencoded"
 
-        # Using model_validate to avoid conflicts with class and type
-        return SirenActionType.model_validate({
-            "href": uri_path,
-            "name": self._name,
-            "fields": self._fields,
-            "method": self._method,
-            "title": self._title,
-            "type": self._type,
-            "class": self._class,
-            "templated": self._templated,
-        })
+        if not self._name or not uri_path:
+            error_message = f"Field name and href are mandatory, {self._name}"
+            raise ValueError(error_message)
+
+        return SirenActionType.model_construct(
+            href=uri_path,
+            name=self._name,
+            fields=fields,
+            method=method,
+            title=self._title,
+            type_=action_type,
+            class_=self._class,
+            templated=self._templated,
+        )
 
 
 class SirenEntityType(SirenBase):
@@ -310,12 +466,28 @@ class SirenEmbeddedType(SirenEntityType):
 
 T = TypeVar("T", bound=Callable[..., Any])
 
-SIREN_RESERVED_FIELDS = {
+SIREN_RESERVED_FIELDS = frozenset({
     "properties",
     "entities",
     "links",
     "actions",
-}
+})
+
+
+def _annotation_may_contain(annotation: Any, targets: Tuple[Type[Any], ...]) -> bool:
+    # Conservative static check used to skip whole validator passes for
+    # subclasses whose fields structurally cannot hold the target types.
+    if annotation is None or annotation is Any:
+        return True
+
+    if isinstance(annotation, type):
+        return issubclass(annotation, targets)
+
+    args = get_args(annotation)
+    if not args:
+        return True
+
+    return any(_annotation_may_contain(arg, targets) for arg in args)
 
 
 class SirenHyperModel(HyperModel):
@@ -326,93 +498,141 @@ class SirenHyperModel(HyperModel):
     links: Sequence[SirenLinkFor] = Field(default_factory=list)
     actions: Sequence[SirenActionFor] = Field(default_factory=list)
 
-    # This config is needed to use the Self in Embedded
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Computed once per subclass so the validators below do not resolve
+    # aliases through model_fields on every instance.
+    alias_map_: ClassVar[Dict[str, str]] = {}
+    _has_hypermodel_children: ClassVar[bool] = True
+    _requires_action_check: ClassVar[bool] = True
+
+    # arbitrary_types_allowed is needed to use the Self in Embedded;
+    # revalidate_instances matches SirenBase since instances only carry
+    # trusted, internally-generated data.
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, revalidate_instances="never"
+    )
 
-    @model_validator(mode="after")
-    def add_hypermodels_to_entities(self: Self) -> Self:
-        entities: List[Union[SirenEmbeddedType, SirenLinkType]] = []
-        for name, field in self:
-            alias = self.model_fields[name].alias or name
+    @classmethod
+    def __pydantic_init_subclass__(cls: Type[Self], **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.alias_map_ = {
+            name: field.alias or name for name, field in cls.model_fields.items()
+        }
+        non_reserved_annotations = [
+            field.annotation
+            for name, field in cls.model_fields.items()
+            if (field.alias or name) not in SIREN_RESERVED_FIELDS
+        ]
+        cls._has_hypermodel_children = any(
+            _annotation_may_contain(annotation, _ENTITY_TYPES)
+            for annotation in non_reserved_annotations
+        )
+        cls._requires_action_check = any(
+            _annotation_may_contain(annotation, (SirenActionFor, SirenActionType))
+            for annotation in non_reserved_annotations
+        )
 
-            if alias in SIREN_RESERVED_FIELDS:
-                continue
+    @model_validator(mode="after")
+    def build_hypermedia(self: Self) -> Self:
+        # Entities, properties, links, actions and the stray-action check
+        # used to be separate validators, each iterating every field; they
+        # are fused into a single traversal so each instance is walked once.
+        entities, properties, moved_fields = self._classify_fields()
 
-            value: Sequence[Union[Any, Self]] = (
-                field if isinstance(field, Sequence) else [field]
-            )
+        # delattr would maintain __pydantic_fields_set__ one field at a time
+        # through the descriptor machinery; removing from __dict__ directly
+        # and batching the bookkeeping is noticeably cheaper per instance.
+        self.__pydantic_fields_set__.difference_update(moved_fields)
 
-            if not all(
-                isinstance(element, (SirenHyperModel, SirenLinkType))
-                for element in value
-            ):
-                continue
+        if self._has_hypermodel_children:
+            self.entities = entities
 
-            for field_ in value:
-                if isinstance(field_, SirenLinkType):
-                    entities.append(field_)
-                    continue
+        self.properties.update(properties)
 
-                child = self.as_embedded(field_, alias)
-                entities.append(child)
+        validated_links: List[SirenLinkFor] = []
+        if self.links:
+            validated_links = self._validate_factory(self.links, self.properties)
+            self.links = validated_links
 
-            delattr(self, name)
+        self.validate_has_self_link(validated_links)
 
-        self.entities = entities
+        if self.actions:
+            self.actions = self._validate_factory(self.actions, self.properties)
 
         return self
 
-    @model_validator(mode="after")
-    def add_properties(self: Self) -> Self:
-        properties = {}
-        for name, field in self:
-            alias = self.model_fields[name].alias or name
+    def _classify_fields(
+        self: Self,
+    ) -> Tuple[
+        List[Union[SirenEmbeddedType, SirenLinkType]], Dict[str, Any], List[str]
+    ]:
+        alias_map = self.alias_map_
+        has_children = self._has_hypermodel_children
+        requires_action_check = self._requires_action_check
 
-            if alias in SIREN_RESERVED_FIELDS:
-                continue
+        entities: List[Union[SirenEmbeddedType, SirenLinkType]] = []
+        properties: Dict[str, Any] = {}
+        moved_fields: List[str] = []
 
-            value: Sequence[Any] = field if isinstance(field, Sequence) else [field]
+        for name, field in list(self.__dict__.items()):
+            alias = alias_map.get(name, name)
 
-            omit_types: Any = (
-                AbstractHyperField,
-                SirenLinkFor,
-                SirenLinkType,
-                SirenActionFor,
-                SirenActionType,
-                SirenHyperModel,
-            )
-            if any(isinstance(value_, omit_types) for value_ in value):
+            if alias in SIREN_RESERVED_FIELDS:
                 continue
 
-            properties[alias] = value if isinstance(field, Sequence) else field
-
-            delattr(self, name)
+            if requires_action_check and isinstance(
+                field, (SirenActionFor, SirenActionType)
+            ):
+                error_message = "All actions must be inside the actions property"
+                raise ValueError(error_message)
+
+            if has_children and self._collect_entities(alias, field, entities):
+                pass
+            elif self._is_property(field):
+                properties[alias] = field
+            else:
+                continue
 
-        if not self.properties:
-            self.properties = {}
+            del self.__dict__[name]
+            moved_fields.append(name)
 
-        self.properties.update(properties)
+        return entities, properties, moved_fields
 
-        return self
+    def _collect_entities(
+        self: Self,
+        alias: str,
+        field: Any,
+        entities: List[Union[SirenEmbeddedType, SirenLinkType]],
+    ) -> bool:
+        value: Sequence[Union[Any, Self]] = (
+            field if isinstance(field, Sequence) else [field]
+        )
 
-    @model_validator(mode="after")
-    def add_links(self: Self) -> Self:
-        links_key = "links"
-        validated_links: List[SirenLinkFor] = []
-        for name, value in self:
-            alias = self.model_fields[name].alias or name
+        if not all(isinstance(element, _ENTITY_TYPES) for element in value):
+            return False
 
-            if alias != links_key or not value:
+        for field_ in value:
+            if isinstance(field_, SirenLinkType):
+                entities.append(field_)
                 continue
 
-            links = cast(Sequence[SirenLinkFor], value)
-            properties = self.properties or {}
-            validated_links = self._validate_factory(links, properties)
-            self.links = validated_links
+            entities.append(self.as_embedded(field_, alias))
 
-        self.validate_has_self_link(validated_links)
+        return True
 
-        return self
+    @staticmethod
+    def _is_property(field: Any) -> bool:
+        if isinstance(field, _OMIT_TYPES):
+            return False
+
+        if isinstance(field, Sequence) and not isinstance(field, str) and field:
+            # Hypermedia sequences are homogeneous, so the first element
+            # settles the common case without scanning the whole list;
+            # the full scan stays as the correctness fallback.
+            return not isinstance(field[0], _OMIT_TYPES) and not any(
+                isinstance(value_, _OMIT_TYPES) for value_ in field
+            )
+
+        return True
 
     @staticmethod
     def validate_has_self_link(links: Sequence[SirenLinkFor]) -> None:
@@ -425,71 +645,88 @@ class SirenHyperModel(HyperModel):
         error_message = "If links are present, a link with rel self must be present"
         raise ValueError(error_message)
 
-    @model_validator(mode="after")
-    def add_actions(self: Self) -> Self:
-        actions_key = "actions"
-        for name, value in self:
-            alias = self.model_fields[name].alias or name
-
-            if alias != actions_key or not value:
-                continue
-
-            properties = self.properties or {}
-            actions = cast(Sequence[SirenActionFor], value)
-            self.actions = self._validate_factory(actions, properties)
-
-        return self
-
     def _validate_factory(
         self: Self, elements: Sequence[T], properties: Mapping[str, str]
     ) -> List[T]:
-        validated_elements: List[T] = []
-        for element_factory in elements:
-            element = element_factory(self._app, properties)
-            if not element:
-                continue
-            validated_elements.append(element)
-        return validated_elements
-
-    @model_validator(mode="after")
-    def no_action_outside_of_actions(self: Self) -> Self:
-        for _, field in self:
-            if not isinstance(field, (SirenActionFor, SirenActionType)):
-                continue
-
-            error_message = "All actions must be inside the actions property"
-            raise ValueError(error_message)
-
-        return self
+        app = self._app
+        return [
+            element
+            for element in (factory(app, properties) for factory in elements)
+            if element
+        ]
 
     @model_serializer
     def serialize(self: Self) -> Mapping[str, Any]:
-        return {self.model_fields[k].alias or k: v for k, v in self if v}
+        alias_map = self.alias_map_
+        return {alias_map.get(k, k): v for k, v in self.__dict__.items() if v}
 
     @staticmethod
     def as_embedded(field: SirenHyperModel, rel: str) -> SirenEmbeddedType:
-        return SirenEmbeddedType(rel=[rel], **field.model_dump())
+        # The child is a fully-validated SirenHyperModel, so its attributes
+        # can be moved over as-is without a model_dump/validate round-trip.
+        return SirenEmbeddedType.model_construct(
+            rel=[rel],
+            properties=field.properties,
+            entities=field.entities,
+            links=field.links,
+            actions=field.actions,
+        )
 
     def parse_uri(self: Self, uri_template: str) -> str:
         return self._parse_uri(self.properties, uri_template)
 
 
+# Field values of any of these types belong to the hypermedia structure, not
+# to the serialized properties mapping.
+_OMIT_TYPES = (
+    AbstractHyperField,
+    SirenLinkType,
+    SirenActionType,
+    SirenHyperModel,
+)
+
+# Field values of these types move into the entities sequence.
+_ENTITY_TYPES = (SirenHyperModel, SirenLinkType)
+
+
+# Compiled once at import time so render does not re-dispatch through
+# jsonschema.validate (which re-checks the schema) on every response.
+_SCHEMA_VALIDATOR_CLASS = jsonschema.validators.validator_for(schema)
+_SCHEMA_VALIDATOR_CLASS.check_schema(schema)
+_SIREN_SCHEMA_VALIDATOR = _SCHEMA_VALIDATOR_CLASS(schema)
+
+
 class SirenResponse(JSONResponse):
     media_type = "application/siren+json"
 
+    # Deployments that trust their own serialization can disable the
+    # per-response schema validation by flipping this class attribute.
+    validate_responses: ClassVar[bool] = True
+
     @staticmethod
     def _validate(content: Any) -> None:
-        jsonschema.validate(instance=content, schema=schema)
+        _SIREN_SCHEMA_VALIDATOR.validate(content)
 
     def render(self: Self, content: Any) -> bytes:
-        self._validate(content)
-        return super().render(content)
+        if self.validate_responses:
+            self._validate(content)
+
+        if orjson is None:
+            return super().render(content)
+
+        return orjson.dumps(content, default=str)  # pylint: disable=no-member
+
+
+# Instantiated once so repeated calls reuse the compiled core-schema
+# validators instead of re-dispatching through model_validate.
+_LINK_ADAPTER: TypeAdapter[SirenLinkType] = TypeAdapter(SirenLinkType)
+_ACTION_ADAPTER: TypeAdapter[SirenActionType] = TypeAdapter(SirenActionType)
 
 
 def get_siren_link(response: Any, link_name: str) -> Union[SirenLinkType, None]:
     links = response.get("links", [])
     link = next((link for link in links if link_name in link.get("rel")), None)
-    return SirenLinkType.model_validate(link) if link else None
+    return _LINK_ADAPTER.validate_python(link) if link else None
 
 
 def get_siren_action(response: Any, action_name: str) -> Union[SirenActionType, None]:
@@ -497,4 +734,4 @@ def get_siren_action(response: Any, action_name: str) -> Union[SirenActionType,
     action = next(
         (action for action in actions if action_name in action.get("name")), None
     )
-    return SirenActionType.model_validate(action) if action else None
+    return _ACTION_ADAPTER.validate_python(action) if action else None
@@ -6,8 +6,10 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
+from weakref import WeakKeyDictionary
 
 from starlette.applications import Starlette
 from starlette.routing import Route
@@ -78,19 +80,42 @@ def resolve_param_values(
     Returns:
         Dict[str, str]: Populated dictionary of URL parameters
     """
+    return resolve_compiled_params(
+        compile_template_params(param_values_template), data_object
+    )
+
+
+def compile_template_params(
+    param_values_template: Optional[Mapping[str, Any]],
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parses a dictionary of URL parameter substitution templates into
+    (parameter name, attribute name) pairs. Parsing only depends on the
+    template mapping, so callers holding a static template can compile it
+    once and reuse the result with resolve_compiled_params.
+    """
     if not param_values_template:
-        return {}
+        return ()
 
-    param_values: Dict[str, Any] = {}
+    compiled = []
     for name, attribute_template in param_values_template.items():
         attribute = _parse_template(str(attribute_template))
         if not attribute:
             continue
 
-        value = extract_value_by_name(data_object, attribute)
-        param_values[name] = value
+        compiled.append((name, attribute))
 
-    return param_values
+    return tuple(compiled)
+
+
+def resolve_compiled_params(
+    compiled_params: Sequence[Tuple[str, str]],
+    data_object: Any,
+) -> Dict[str, Any]:
+    return {
+        name: extract_value_by_name(data_object, attribute)
+        for name, attribute in compiled_params
+    }
 
 
 def extract_value_by_name(
@@ -112,12 +137,25 @@ def get_hal_link_href(response: Any, link_name: str) -> Union[str, Any]:
     return response.get("_links", {}).get(link_name, {}).get("href", "")
 
 
+# Resolved routes per application, so repeated lookups do not rescan the
+# route table. Weakly keyed to let test applications be garbage collected.
+_route_cache: "WeakKeyDictionary[Starlette, Dict[str, Route]]" = WeakKeyDictionary()
+
+
 def get_route_from_app(app: Starlette, endpoint_function: str) -> Route:
+    routes = _route_cache.get(app)
+    if routes is None:
+        routes = {}
+        _route_cache[app] = routes
+
+    cached_route = routes.get(endpoint_function)
+    if cached_route is not None:
+        return cached_route
+
     for route in app.routes:
         if isinstance(route, Route) and route.name == endpoint_function:
-            break
-    else:
-        error_message = f"No route found for endpoint {endpoint_function}"
-        raise ValueError(error_message)
+            routes[endpoint_function] = route
+            return route
 
-    return route
+    error_message = f"No route found for endpoint {endpoint_function}"
+    raise ValueError(error_message)
@@ -377,6 +377,15 @@ def test_hal_response_invalid(hal_app: FastAPI, invalid_response: Any) -> None:
         test_client.get(endpoint)
 
 
+def test_hal_response_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("fastapi_hypermodel.hal.orjson", None)
+
+    content = {"_links": {"self": {"href": "/self"}}}
+    response = HALResponse(content=content)
+
+    assert response.body == b'{"_links":{"self":{"href":"/self"}}}'
+
+
 def test_hal_response_empty(hal_app: FastAPI) -> None:
     @hal_app.get("/test_response", response_class=HALResponse)
     def _() -> Any:
@@ -1,12 +1,14 @@
-from typing import Any, Optional, Sequence
+import datetime
+from typing import Any, Dict, Optional, Sequence
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from pydantic.fields import FieldInfo
 
 from fastapi_hypermodel import (
+    AbstractHyperField,
     SirenActionFor,
     SirenActionType,
     SirenEmbeddedType,
@@ -71,6 +73,24 @@ def test_content_type(siren_client: TestClient) -> None:
     assert content_type == "application/siren+json"
 
 
+def test_siren_response_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("fastapi_hypermodel.siren.orjson", None)
+
+    content = {"links": [{"rel": ["self"], "href": "/self"}]}
+    response = SirenResponse(content=content)
+
+    assert response.body == b'{"links":[{"rel":["self"],"href":"/self"}]}'
+
+
+def test_siren_response_validation_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SirenResponse, "validate_responses", False)
+
+    invalid_content = {"links": "not-a-sequence"}
+    response = SirenResponse(content=invalid_content)
+
+    assert response.body
+
+
 # SirenLinkFor
 
 
@@ -223,6 +243,26 @@ def test_siren_field_type_parse_type_dict() -> None:
     assert html_type == "text"
 
 
+def test_siren_field_type_parse_type_checkbox() -> None:
+    python_type = Optional[bool]
+    html_type = SirenFieldType.parse_type(python_type)
+
+    assert html_type == "checkbox"
+
+
+def test_siren_field_type_parse_type_file() -> None:
+    python_type = Optional[bytes]
+    html_type = SirenFieldType.parse_type(python_type)
+
+    assert html_type == "file"
+
+
+def test_siren_field_type_parse_type_temporal() -> None:
+    assert SirenFieldType.parse_type(datetime.date) == "date"
+    assert SirenFieldType.parse_type(datetime.datetime) == "datetime"
+    assert SirenFieldType.parse_type(datetime.time) == "time"
+
+
 def test_siren_field_type_from_field_info() -> None:
     field_info = FieldInfo()
     field_type = SirenFieldType.from_field_info("test", field_info)
@@ -412,6 +452,46 @@ def test_siren_action_for_with_fields(siren_app: FastAPI) -> None:
     assert siren_action_for_type.type_ == "application/x-www-form-urlencoded"
 
 
+def test_siren_action_for_populates_missing_values_as_none(
+    siren_app: FastAPI,
+) -> None:
+    mock = MockClass(id_="test")
+
+    siren_action_for = SirenActionFor(
+        "mock_read_with_path_siren_with_hypermodel", name="test"
+    )
+    assert mock.properties
+    siren_action_for_type = siren_action_for(siren_app, mock.properties)
+
+    assert isinstance(siren_action_for_type, SirenActionType)
+
+    fields = siren_action_for_type.fields
+    assert fields
+    assert all(field.value is None for field in fields)
+
+
+def test_siren_action_for_populates_values_from_properties(
+    siren_app: FastAPI,
+) -> None:
+    siren_action_for = SirenActionFor(
+        "mock_read_with_path_siren_with_hypermodel", name="test"
+    )
+    siren_action_for_type = siren_action_for(
+        siren_app, {"name": "test_name", "lenght": 10.0}
+    )
+
+    assert isinstance(siren_action_for_type, SirenActionType)
+
+    fields = siren_action_for_type.fields
+    assert fields
+    assert any(
+        field.name == "name" and field.value == "test_name" for field in fields
+    )
+    assert any(
+        field.name == "lenght" and field.value == "10.0" for field in fields
+    )
+
+
 def test_siren_action_for_with_fields_no_populate(siren_app: FastAPI) -> None:
     mock = MockClass(id_="test")
 
@@ -436,6 +516,40 @@ def test_siren_action_for_with_fields_no_populate(siren_app: FastAPI) -> None:
     assert siren_action_for_type.type_ == "application/x-www-form-urlencoded"
 
 
+def test_siren_action_for_with_explicit_fields(siren_app: FastAPI) -> None:
+    mock = MockClass(id_="test")
+
+    siren_action_for = SirenActionFor(
+        "mock_read_with_path_siren",
+        {"id_": "<id_>"},
+        name="test",
+        fields=[SirenFieldType(name="name")],
+        populate_fields=False,
+    )
+    assert mock.properties
+    siren_action_for_type = siren_action_for(siren_app, mock.properties)
+
+    assert isinstance(siren_action_for_type, SirenActionType)
+    assert siren_action_for_type.fields
+    assert siren_action_for_type.type_ == "application/x-www-form-urlencoded"
+
+
+def test_siren_action_for_with_untyped_body(siren_app: FastAPI) -> None:
+    @siren_app.put("siren_with_untyped_body", response_class=SirenResponse)
+    def mock_update_with_untyped_body(
+        payload: Dict[str, Any],
+    ) -> Any:  # pragma: no cover
+        return payload
+
+    mock = MockClass(id_="test")
+
+    siren_action_for = SirenActionFor("mock_update_with_untyped_body", name="test")
+    siren_action_for_type = siren_action_for(siren_app, mock.properties)
+
+    assert isinstance(siren_action_for_type, SirenActionType)
+    assert not siren_action_for_type.fields
+
+
 # SirenHypermodel
 
 
@@ -456,6 +570,34 @@ def test_siren_hypermodel_with_entities_embedded_hypermodel() -> None:
     assert first.properties.get("id_") == "test_nested"
 
 
+def test_siren_hypermodel_with_entities_in_any_field() -> None:
+    class MockClassWithAnyField(SirenHyperModel):
+        id_: str
+        model: Any = None
+
+    mock = MockClassWithAnyField(id_="test", model=MockClass(id_="test_nested"))
+    assert mock.entities
+
+    first, *_ = mock.entities
+    assert isinstance(first, SirenEmbeddedType)
+    assert first.rel == ["model"]
+
+
+def test_siren_hypermodel_with_entities_in_untyped_sequence() -> None:
+    class MockClassWithUntypedSequence(SirenHyperModel):
+        id_: str
+        models: Sequence = ()
+
+    mock = MockClassWithUntypedSequence(
+        id_="test", models=[MockClass(id_="test_nested")]
+    )
+    assert mock.entities
+
+    first, *_ = mock.entities
+    assert isinstance(first, SirenEmbeddedType)
+    assert first.rel == ["models"]
+
+
 def test_siren_hypermodel_with_entities_embedded_link() -> None:
     class MockClassWithEmbeddedLink(SirenHyperModel):
         id_: str
@@ -472,6 +614,35 @@ def test_siren_hypermodel_with_entities_embedded_link() -> None:
     assert first.href == "test_nested"
 
 
+def test_siren_hypermodel_with_mixed_sequence() -> None:
+    class MockClassWithMixedSequence(SirenHyperModel):
+        id_: str
+        mixed: Sequence[Any] = ()
+
+    mock = MockClassWithMixedSequence(
+        id_="test", mixed=[MockClass(id_="test_nested"), "plain"]
+    )
+
+    assert not mock.entities
+    assert "mixed" not in mock.properties
+    assert mock.mixed
+
+
+def test_siren_hypermodel_with_unresolved_hyperfield() -> None:
+    class MockHyperField(AbstractHyperField[SirenLinkType]):
+        def __call__(self, *_: Any) -> Any:
+            return self
+
+    class MockClassWithHyperField(SirenHyperModel):
+        id_: str
+        custom: Any = None
+
+    mock = MockClassWithHyperField(id_="test", custom=MockHyperField())
+
+    assert not mock.entities
+    assert "custom" not in mock.properties
+
+
 @pytest.mark.usefixtures("siren_app")
 def test_siren_hypermodel_with_links() -> None:
     class MockClassWithLinks(SirenHyperModel):
@@ -558,6 +729,38 @@ def test_siren_hypermodel_with_actions_empty() -> None:
     assert not mock.actions
 
 
+@pytest.mark.usefixtures("siren_app")
+def test_init_app_binds_field_defaults(siren_app: FastAPI) -> None:
+    class MockClassWithBoundDefaults(SirenHyperModel):
+        id_: str
+
+        links: Sequence[SirenLinkFor] = (
+            SirenLinkFor("mock_read_with_path_siren", {"id_": "<id_>"}, rel=["self"]),
+        )
+
+        actions: Sequence[SirenActionFor] = (
+            SirenActionFor("mock_read_with_path_siren_with_hypermodel", name="test"),
+        )
+
+    SirenHyperModel.init_app(siren_app)
+
+    mock = MockClassWithBoundDefaults(id_="test")
+
+    assert mock.links
+    assert mock.actions
+
+    first_action, *_ = mock.actions
+    assert first_action.fields
+
+
+def test_siren_hypermodel_serialize() -> None:
+    mock = MockClass(id_="test")
+
+    dumped = mock.model_dump()
+    assert dumped.get("properties") == {"id_": "test"}
+    assert "links" not in dumped
+
+
 def test_siren_parse_uri() -> None:
     uri_template = "/model/{id_}"
 
@@ -585,6 +788,13 @@ def test_get_siren_link_href(siren_response: Any) -> None:
     assert actual == expected
 
 
+def test_get_siren_link_invalid(siren_response: Any) -> None:
+    siren_response["links"] = [{"rel": ["self"], "href": ""}]
+
+    with pytest.raises(ValidationError, match="Field rel and href are mandatory"):
+        get_siren_link(siren_response, "self")
+
+
 def test_get_siren_link_href_not_found(siren_response: Any) -> None:
     actual = get_siren_link(siren_response, "update")
     assert actual is None
@@ -597,6 +807,13 @@ def test_get_siren_action_href(siren_response: Any) -> None:
     assert actual == expected
 
 
+def test_get_siren_action_invalid(siren_response: Any) -> None:
+    siren_response["actions"] = [{"name": "add", "href": ""}]
+
+    with pytest.raises(ValidationError, match="Field name and href are mandatory"):
+        get_siren_action(siren_response, "add")
+
+
 def test_get_siren_action_href_not_found(siren_response: Any) -> None:
     actual = get_siren_action(siren_response, "update")
     assert actual is None